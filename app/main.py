@@ -5,8 +5,7 @@ import time
 import signal
 import sys
 
-from app.services.async_docker import AsyncLogMonitor
-from app.services.sync_docker import SyncDocker
+from app.services.async_docker import AsyncDocker, AsyncLogMonitor, create_docker_client
 from app.services.spt_server import SPTServer
 
 # Configure logging
@@ -28,36 +27,63 @@ class FikaMonitor:
         self.shutdown_delay = shutdown_delay
         
         # State tracking
-        self.current_time: float = time.time()
-        self.last_activity_time: float = time.time()
+        self.current_time: float = time.monotonic()
+        self.last_activity_time: float = time.monotonic()
         self.shutdown_time: float = self.last_activity_time + self.shutdown_delay
         self.is_running = True
 
         self.waiting_for_headless_start: bool = False
 
-        self.sync_docker = SyncDocker()
+        # Debounce for activity_detected: raid traffic can match many log
+        # lines per second, only the first in a window needs a status check
+        self._last_status_check: float = 0.0
+        self._status_check_interval: float = 5.0
+
+        # Suppress duplicate "Activity detected" floods during raids
+        self._last_logged_activity: str = ""
+        self._last_activity_log_time: float = 0.0
+
+        # Wakes the maintenance loop when the shutdown deadline moves
+        self._activity_event = asyncio.Event()
+
+        # Needs a running event loop, created at the top of run()
+        self.async_docker: AsyncDocker = None
         self.spt_server = SPTServer(self.server_container_name)
-                
-        # Setup signal handlers
-        signal.signal(signal.SIGINT, self.handle_shutdown)
-        signal.signal(signal.SIGTERM, self.handle_shutdown)
-    
-    def handle_shutdown(self, signum, frame):
+
+        self._tasks: list[asyncio.Task] = []
+
+    def handle_shutdown(self, signum):
         """Handle shutdown signals gracefully."""
         logger.info(f"Received signal {signum}, shutting down...")
         self.is_running = False
+        self._activity_event.set()
+        for task in self._tasks:
+            task.cancel()
 
     async def activity_detected(self, msg: str):
-        logger.info(f"Activity detected: {msg}")
+        self.current_time = time.monotonic()
+
+        # one line per distinct message per 10s, raids repeat the same ping
+        if msg != self._last_logged_activity or self.current_time - self._last_activity_log_time > 10:
+            logger.info("Activity detected: %s", msg)
+            self._last_logged_activity = msg
+            self._last_activity_log_time = self.current_time
+
         self.last_activity_time = self.current_time
         self.shutdown_time = self.last_activity_time + self.shutdown_delay
+        self._activity_event.set()
+
+        # bumping the timestamps is cheap, the status check is not
+        if self.current_time - self._last_status_check < self._status_check_interval:
+            return
+        self._last_status_check = self.current_time
 
         # immediately start container if not running
-        container_status = self.sync_docker.get_container_status(self.headless_container_name)
+        container_status = await self.async_docker.get_container_status(self.headless_container_name)
         if container_status != "running":
             self.waiting_for_headless_start = True
-            self.sync_docker.start_container(self.headless_container_name)
-            await self.spt_server.fika_notification('Player activity detected, starting headless client...', 0)
+            await self.async_docker.start_container(self.headless_container_name)
+            self.spt_server.fika_notification('Player activity detected, starting headless client...', 0)
 
     # TODO: monitor headless client logs as well?
     # One issue is reconnecting to the docker container on every restart
@@ -73,13 +99,11 @@ class FikaMonitor:
                 
                 if activity_message == 'headless_started':
                     if self.waiting_for_headless_start:
-                        await self.spt_server.fika_notification('Headless client is available.', 5)
+                        self.spt_server.fika_notification('Headless client is available.', 5)
                         self.waiting_for_headless_start = False
                 else:
                     # Update last activity time
                     await self.activity_detected(msg=activity_message)
-
-                await asyncio.sleep(0)
     
     async def check_players_api(self) -> int:
         """Check for players via API."""
@@ -92,37 +116,44 @@ class FikaMonitor:
         return 0
 
     async def maintenance_loop(self):
-        """Main maintenance loop - checks API and shuts down the container."""
-        
-        while self.is_running:
+        """Main maintenance loop - sleeps until the shutdown deadline and stops the container."""
 
-            await asyncio.sleep(5) # relax
+        while self.is_running:
 
             try:
-                self.current_time = time.time()
-
-                # if it's not time to shutdown, we do nothing
-                if self.current_time < self.shutdown_time:
-                    continue
-
-                container_status = self.sync_docker.get_container_status(self.headless_container_name)
-                # if the container is not running, do nothing
+                self.current_time = time.monotonic()
+
+                # sleep until the deadline, waking early on new activity
+                delay = max(0.0, self.shutdown_time - self.current_time)
+                try:
+                    await asyncio.wait_for(self._activity_event.wait(), timeout=delay)
+                    self._activity_event.clear()
+                    continue  # the deadline moved, recompute
+                except asyncio.TimeoutError:
+                    pass  # deadline reached with no new activity
+
+                self.current_time = time.monotonic()
+
+                # it's time to shutdown, do a final check; the status inspect
+                # and the player poll are independent, so overlap them
+                container_status, players_online = await asyncio.gather(
+                    self.async_docker.get_container_status(self.headless_container_name),
+                    self.check_players_api()
+                )
+
+                # if the container is not running there is nothing to stop,
+                # re-arm the timer rather than spinning on an expired deadline
                 if container_status != "running":
+                    self.shutdown_time = self.current_time + self.shutdown_delay
                     continue
-                
-                # it's time to shutdown, do a final check
-                players_online = await self.check_players_api()
                 if players_online > 0:
                     await self.activity_detected(msg=f'{players_online} players online, aborting shutdown')
                     continue
-                
-                if container_status == "running":
-                    logger.info(f"No activity for {self.shutdown_delay}s, {players_online} players online, stopping container")
-                    self.sync_docker.stop_container(self.headless_container_name)
-                else:
-                    logger.warning(f"Intended to shutdown but the container was not running, status: {container_status}")
 
-                
+                logger.info(f"No activity for {self.shutdown_delay}s, {players_online} players online, stopping container")
+                await self.async_docker.stop_container(self.headless_container_name)
+                self.shutdown_time = self.current_time + self.shutdown_delay
+
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -133,12 +164,16 @@ class FikaMonitor:
         """Wait for initial conditions to be met."""
         logger.info("Waiting for fika-server container...")
         
-        start_time = time.time()
-        while self.is_running and (time.time() - start_time) < timeout:
+        start_time = time.monotonic()
+        # Back off exponentially: probe quickly at first so we catch the
+        # server the moment it comes up, then settle towards 2s
+        delay = 0.2
+        while self.is_running and (time.monotonic() - start_time) < timeout:
             if await self.spt_server.ping_server():
                 return True
-            
-            await asyncio.sleep(2)
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, 2.0)
         
         logger.warning(f"fika-server container not found after {timeout}s")
         return False
@@ -147,42 +182,43 @@ class FikaMonitor:
         """Main entry point."""
         logger.info(f"Starting fika monitor for container '{self.headless_container_name}'")
         logger.info(f"Shutdown delay: {self.shutdown_delay}s")
-        
-        if not await self.wait_for_initialization():
-            logger.error("Failed to initialize, exiting")
-            return
 
-        # Get initial container status
-        initial_status = self.sync_docker.get_container_status(self.headless_container_name)
-        logger.info(f"Initial container status: {initial_status}")
-
-        # Initialize last activity time if container is already running
-        if initial_status == "running":
-            self.last_activity_time = time.time()
-            logger.info(f"Container already running, tracking activity from now")
-        
-        # Start tasks
-        log_monitor_task = asyncio.create_task(self.monitor_logs_task())
-        maintenance_task = asyncio.create_task(self.maintenance_loop())
-
-        # Wait for tasks to complete
-        try:
-            await asyncio.gather(log_monitor_task, maintenance_task)
-        except asyncio.CancelledError:
-            logger.info("Tasks cancelled")
-        finally:
-            # Cancel tasks
-            log_monitor_task.cancel()
-            maintenance_task.cancel()
-            
-            # Wait for tasks to finish cancellation
-            await asyncio.gather(
-                log_monitor_task,
-                maintenance_task,
-                return_exceptions=True
-            )
-            
-            logger.info("fika monitor stopped")
+        # Signal handlers run on the event loop instead of interrupting
+        # whatever C code happens to be executing
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGINT, self.handle_shutdown, signal.SIGINT)
+        loop.add_signal_handler(signal.SIGTERM, self.handle_shutdown, signal.SIGTERM)
+
+        # One aiodocker client, shared by container ops and log streaming
+        docker_client = create_docker_client()
+        self.async_docker = AsyncDocker()
+        async with self.spt_server:
+            if not await self.wait_for_initialization():
+                logger.error("Failed to initialize, exiting")
+                await docker_client.close()
+                return
+
+            # Get initial container status
+            initial_status = await self.async_docker.get_container_status(self.headless_container_name)
+            logger.info(f"Initial container status: {initial_status}")
+
+            # Initialize last activity time if container is already running
+            if initial_status == "running":
+                self.last_activity_time = time.monotonic()
+                logger.info(f"Container already running, tracking activity from now")
+
+            # Run tasks; the TaskGroup handles cancellation and exception
+            # propagation, and handle_shutdown cancels the group's tasks
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    self._tasks = [
+                        tg.create_task(self.monitor_logs_task()),
+                        tg.create_task(self.maintenance_loop())
+                    ]
+            finally:
+                self._tasks = []
+                await docker_client.close()
+                logger.info("fika monitor stopped")
 
 
 def main():
@@ -4,95 +4,233 @@ import traceback
 import time
 import re
 
+from contextvars import ContextVar
 from typing import AsyncGenerator
-from aiodocker import Docker
+from aiodocker import Docker, DockerError
 from aiodocker.containers import DockerContainer
-from aiohttp import ClientSession, UnixConnector, ClientTimeout
+from aiohttp import ClientConnectionError, ClientSession, UnixConnector, ClientTimeout
 
 logger = logging.getLogger(__name__)
 
+# One aiodocker client (and unix-socket connection pool) shared by the log
+# monitor and the container-ops service, published by FikaMonitor.run
+_docker_client: ContextVar[Docker] = ContextVar('docker_client')
+
+def create_docker_client() -> Docker:
+    """Create the shared aiodocker client and publish it for this context.
+
+    The caller owns the client and is responsible for closing it.
+    """
+    docker = Docker(
+        session=ClientSession(
+            connector=UnixConnector('/var/run/docker.sock'),
+            timeout=ClientTimeout(total=None, connect=30, sock_connect=30, sock_read=600)
+        )
+    )
+    _docker_client.set(docker)
+    return docker
+
+
+class AsyncDocker:
+    """Container operations via aiodocker, so Docker API calls don't block the event loop."""
+
+    def __init__(self):
+        self.docker = _docker_client.get()
+        # Status lookups are cheap to cache: several callers ask within the
+        # same 5s maintenance tick and each miss is a daemon round-trip.
+        self._status_cache: dict[str, tuple[float, str]] = {}
+        self._status_ttl = 3.0
+
+    async def get_container_status(self, container_name: str) -> str:
+        """Get the status of the Docker container (cached for a few seconds)."""
+        cached = self._status_cache.get(container_name)
+        if cached is not None:
+            cached_at, status = cached
+            if time.monotonic() - cached_at < self._status_ttl:
+                return status
+
+        try:
+            # containers.get() is a single inspect call; the payload carries the state
+            container = await self.docker.containers.get(container_name)
+            status = container['State']['Status']
+        except DockerError as e:
+            if e.status == 404:
+                logger.error(f"Container '{container_name}' not found")
+                status = "not_found"
+            else:
+                logger.error(f"Docker API error: {e}")
+                status = "error"
+
+        self._status_cache[container_name] = (time.monotonic(), status)
+        return status
+
+    async def start_container(self, container_name: str):
+        """Start the Docker container."""
+        try:
+            container = await self.docker.containers.get(container_name)
+            if container['State']['Status'] != "running":
+                await container.start()
+                logger.info(f"Started container '{container_name}'")
+            else:
+                logger.debug(f"Container '{container_name}' is already running")
+        except DockerError as e:
+            if e.status == 404:
+                logger.error(f"Container '{container_name}' not found")
+            else:
+                logger.error(f"Failed to start container: {e}")
+        # Drop the cached status so the transition is visible immediately
+        self._status_cache.pop(container_name, None)
+
+    async def stop_container(self, container_name: str):
+        """Stop the Docker container."""
+        try:
+            container = await self.docker.containers.get(container_name)
+            if container['State']['Status'] == "running":
+                await container.stop()
+                logger.info(f"Stopped container '{container_name}'")
+            else:
+                logger.debug(f"Container '{container_name}' is already stopped")
+        except DockerError as e:
+            if e.status == 404:
+                logger.error(f"Container '{container_name}' not found")
+            else:
+                logger.error(f"Failed to stop container: {e}")
+        # Drop the cached status so the transition is visible immediately
+        self._status_cache.pop(container_name, None)
+
+
 class AsyncLogMonitor:
     """Asynchronous log monitor using aiodocker."""
-    
+
     def __init__(self, container_name: str):
         self.container_name = container_name
-        self.docker = Docker(
-            session=ClientSession(
-                connector=UnixConnector('/var/run/docker.sock'),
-                timeout=ClientTimeout(total=None, connect=30, sock_connect=30, sock_read=None)
-            )
-        )
+        self.docker = _docker_client.get()
         self.container: DockerContainer = None
         self.is_running = True
+        # Deliberately wall-clock: the docker log since= parameter wants a
+        # UNIX epoch timestamp, not a monotonic reading
         self.start_time = time.time()
+        self.last_line_time = self.start_time
+        self._lines_since_yield = 0
+        # Finite read timeout so a silently dropped docker socket (daemon
+        # restart, host suspend) surfaces instead of hanging forever
+        self._log_read_timeout = 600
 
         # TODO: put this in env variables?
-        self.activity_messages = [
-            '/launcher/profile/login', # indicates a player is logging in
-            '/launcher/server/version', # indicates player is in-game, may be unnecessary
-            '/fika/presence/set', # indicates menu/stach/hideout activity
-            '/fika/update/ping' # indicates raid activity
-        ]
+        # One alternation pattern so each log line is scanned once instead of
+        # once per activity message. aiodocker decodes log frames to str, so
+        # the pattern is text rather than bytes.
+        self._activity_pattern = re.compile(
+            r"(?P<login>/launcher/profile/login)" # indicates a player is logging in
+            r"|(?P<version>/launcher/server/version)" # indicates player is in-game, may be unnecessary
+            r"|(?P<presence>/fika/presence/set)" # indicates menu/stach/hideout activity
+            r"|(?P<ping>/fika/update/ping)" # indicates raid activity
+            r"|(?P<headless>headless_[^\n]*?has connected)" # headless client came up
+        )
+        self._activity_map = {
+            'login': '/launcher/profile/login',
+            'version': '/launcher/server/version',
+            'presence': '/fika/presence/set',
+            'ping': '/fika/update/ping',
+            'headless': 'headless_started'
+        }
 
         
     async def connect(self):
         """Connect to the Docker container."""
         try:
-            # Get the container
-            containers = await self.docker.containers.list()
-            for container in containers:
-                container_info = await container.show()
-                if container_info['Name'].lstrip('/') == self.container_name:
-                    self.container = container
-                    logger.info(f"Connected to container: {self.container_name}")
-                    return
-            
-            logger.error(f"Container not found: {self.container_name}")
-            raise ValueError(f"Container not found: {self.container_name}")
-            
+            # Direct lookup: one inspect call instead of listing and
+            # inspecting every container on the host
+            self.container = await self.docker.containers.get(self.container_name)
+            logger.info(f"Connected to container: {self.container_name}")
+
+        except DockerError as e:
+            if e.status == 404:
+                logger.error(f"Container not found: {self.container_name}")
+                raise ValueError(f"Container not found: {self.container_name}") from e
+            logger.error(f"Failed to connect to container: {e}")
+            raise
         except Exception as e:
             logger.error(f"Failed to connect to container: {e}")
             raise
     
     async def stream_logs(self) -> AsyncGenerator[str, None]:
-        """Stream logs from the container asynchronously."""
-        if not self.container:
-            await self.connect()
-        
-        try:
-            # Start streaming logs
-            async for line in self.container.log(
-                stdout=True,
-                stderr=True,
-                follow=True,
-                timestamps=False,
-                since=self.start_time
-            ):
-                if not self.is_running:
-                    break
-                yield line
-                
-        except asyncio.CancelledError:
-            logger.info("Log streaming cancelled")
-        except Exception as e:
-            traceback.print_exc()
-            logger.error(f"Error streaming logs: {e}")
+        """Stream logs from the container asynchronously, one complete line at
+        a time, reconnecting if the socket goes quiet for too long."""
+        while self.is_running:
+            if not self.container:
+                await self.connect()
+
+            try:
+                # Log frames are not guaranteed to be line-aligned, so buffer and
+                # split on newlines; otherwise a match can be cut across chunks
+                buf = ""
+                async for chunk in self.container.log(
+                    stdout=True,
+                    stderr=True,
+                    follow=True,
+                    timestamps=False,
+                    since=self.start_time,
+                    timeout=ClientTimeout(
+                        total=None, connect=30, sock_connect=30,
+                        sock_read=self._log_read_timeout
+                    )
+                ):
+                    if not self.is_running:
+                        return
+                    self.last_line_time = time.time()
+                    buf += chunk
+                    while (newline := buf.find('\n')) != -1:
+                        line, buf = buf[:newline], buf[newline + 1:]
+                        yield line
+                if buf:
+                    yield buf
+
+            except asyncio.CancelledError:
+                logger.info("Log streaming cancelled")
+                return
+            except (asyncio.TimeoutError, ClientConnectionError) as e:
+                logger.warning(f"Log stream error: {str(e) or type(e).__name__}")
+            except Exception as e:
+                traceback.print_exc()
+                logger.error(f"Error streaming logs: {e}")
+                return
+
+            # aiodocker swallows read timeouts and dropped connections inside
+            # its frame reader and just ends the iteration, so reaching here
+            # means the stream is gone - idle past the read timeout, a daemon
+            # restart, or the container stopping. Resubscribe from the last
+            # line we actually saw; the sleep keeps this from hot-looping
+            # while the container is down.
+            if not self.is_running:
+                return
+            logger.warning(f"Log stream for '{self.container_name}' ended, reconnecting...")
+            self.start_time = self.last_line_time
+            self.container = None
+            await asyncio.sleep(2)
     
     async def monitor_for_activity(self) -> AsyncGenerator[str, None]:
         """Monitor logs for activity."""
         async for line in self.stream_logs():
-            for activity_message in self.activity_messages:
-                if activity_message in line:
-                    yield activity_message
-            
-            if re.search('(headless_).*(has connected)', line):
-                yield 'headless_started'
-            await asyncio.sleep(0)
+            # Fast substring prefilter: most lines are HTTP access noise and
+            # match none of these, so skip the regex machinery entirely
+            if '/fika/' in line or '/launcher/' in line or 'headless_' in line:
+                match = self._activity_pattern.search(line)
+                if match:
+                    yield self._activity_map[match.lastgroup]
+
+            # aiohttp already yields to the loop between network reads, so
+            # only force a reschedule occasionally in case one chunk carries
+            # a large burst of buffered lines
+            self._lines_since_yield += 1
+            if self._lines_since_yield >= 256:
+                self._lines_since_yield = 0
+                await asyncio.sleep(0)
     
     async def close(self):
-        """Clean up resources."""
+        """Stop streaming. The shared docker client is owned by the caller of
+        create_docker_client() and stays open."""
         self.is_running = False
-        await self.docker.close()
     
     async def __aenter__(self):
         await self.connect()
@@ -1,8 +1,10 @@
+import asyncio
 import logging
-import json
+
+import orjson
 
 from typing import Any, Dict, List
-from aiohttp import ClientError, ClientSession, ClientTimeout
+from aiohttp import ClientError, ClientSession, ClientTimeout, TCPConnector
 
 logger = logging.getLogger(__name__)
 
@@ -10,57 +12,76 @@ class SPTServer:
     """
     Class that represents the SPT server. For api access, or whatever
 
-    Warning: If you re-use a client session for multiple requests, you will regret it.
+    Owns one long-lived ClientSession (use as an async context manager) so
+    every poll reuses the same keep-alive connection instead of paying a
+    fresh TCP+TLS handshake per request.
     """
-    
+
     def __init__(self, container_name: str):
         self.container_name = container_name
         self.headers = {
             "responsecompressed": "0",
             "Content-Type": "application/json"
         }
+        self._session: ClientSession = None
+        self._notification_queue: asyncio.Queue = asyncio.Queue()
+        self._notification_task: asyncio.Task = None
+
+    async def __aenter__(self):
+        self._session = ClientSession(
+            headers=self.headers,
+            # ssl=False: disable SSL verification (equivalent to -k)
+            connector=TCPConnector(ssl=False, limit=4, keepalive_timeout=60),
+            timeout=ClientTimeout(total=10)
+        )
+        self._notification_task = asyncio.create_task(self._notification_worker())
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._notification_task.cancel()
+        try:
+            await self._notification_task
+        except asyncio.CancelledError:
+            pass
+        await self._session.close()
 
     # TODO: Possibly add pydantic models to validate API responses? perhaps overcomplicate things for no reason?
     async def fetch_online_players(self) -> List[Dict[str, Any]]:
         """Check for connected players via API."""
         try:
-            async with ClientSession(headers=self.headers) as session:
-                async with session.get(
-                    url=f"https://{self.container_name}:6969/fika/presence/get",
-                    ssl=False,  # Disable SSL verification (equivalent to -k)
-                    timeout=ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        players = await response.json()
-                        logger.debug(f"API response: {players}")
-                        return players
-                    else:
-                        logger.warning(f"API returned status {response.status}")
-                        return []
+            async with self._session.get(
+                url=f"https://{self.container_name}:6969/fika/presence/get"
+            ) as response:
+                if response.status == 200:
+                    # orjson parses straight from bytes, skipping the stdlib decoder
+                    players = orjson.loads(await response.read())
+                    # %-style so the payload is only stringified when DEBUG is on
+                    logger.debug("API response: %s", players)
+                    return players
+                else:
+                    logger.warning(f"API returned status {response.status}")
+                    return []
         except ClientError as e:
             logger.warning(f"Failed to check player presence: {e}")
             return []
-        
+
 
     async def ping_server(self) -> bool:
         """Ping the server"""
         try:
-            async with ClientSession() as session:
-                async with session.get(
-                    url=f"https://{self.container_name}:6969/launcher/ping",
-                    ssl=False,  # Disable SSL verification (equivalent to -k)
-                    timeout=ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        return True
-                    else:
-                        logger.warning(f"Ping returned status {response.status}")
-                        return False
+            async with self._session.get(
+                url=f"https://{self.container_name}:6969/launcher/ping"
+            ) as response:
+                if response.status == 200:
+                    return True
+                else:
+                    logger.warning(f"Ping returned status {response.status}")
+                    return False
         except ClientError as e:
             logger.warning(f"Server did not pong: {e}")
             return False
-        
-    async def fika_notification(self, msg: str, icon: int):
+
+    def fika_notification(self, msg: str, icon: int):
         """
         Send notification to logged in users
         icon: 0 = warning(green)
@@ -69,25 +90,47 @@ class SPTServer:
               3 = mail(green)
               4 = clipboard(green)
               5 = checkmark(yellow)
+
+        Enqueues without blocking; a worker coalesces bursts into one POST
+        per icon, keeping the latest message.
         """
+        self._notification_queue.put_nowait((msg, icon))
+
+    async def _notification_worker(self):
+        """Drain the notification queue, coalescing bursts before sending."""
+        while True:
+            msg, icon = await self._notification_queue.get()
+            try:
+                # short window to let a burst accumulate
+                await asyncio.sleep(0.2)
+                latest = {icon: msg}
+                while not self._notification_queue.empty():
+                    msg, icon = self._notification_queue.get_nowait()
+                    latest[icon] = msg
+                for icon, msg in latest.items():
+                    await self._send_notification(msg, icon)
+            except Exception as e:
+                # _send_notification only absorbs ClientError; anything else
+                # (timeouts, a closed session during shutdown) must not kill
+                # the worker and silently strand the queue
+                logger.error(f"Error in notification worker: {e}")
+
+    async def _send_notification(self, msg: str, icon: int):
         payload = {
             'notification': msg,
             'notificationIcon': icon
         }
         try:
-            async with ClientSession(headers=self.headers) as session:
-                async with session.post(
-                    url=f"https://{self.container_name}:6969/fika/notification/push",
-                    ssl=False,  # Disable SSL verification (equivalent to -k)
-                    timeout=ClientTimeout(total=10),
-                    json=payload,
-                    compress=True
-                ) as response:
-                    if response.status == 200:
-                        logger.info(f'Notification sent: {msg}')
-                    else:
-                        logger.error(f"Notification request returned status {response.status}")
+            async with self._session.post(
+                url=f"https://{self.container_name}:6969/fika/notification/push",
+                # Content-Type: application/json is already in the session headers
+                data=orjson.dumps(payload)
+            ) as response:
+                if response.status == 200:
+                    logger.info(f'Notification sent: {msg}')
+                else:
+                    logger.error(f"Notification request returned status {response.status}")
         except ClientError as e:
             logger.error(f"Notification request error: {e}")
-    
+
 